@@ -1,22 +1,30 @@
 #!/usr/bin/env python3
 
+from std_msgs.msg import String
+
 from turtle_movement.TurtleShape import TurtleShape
 
 class TurtleRectangle(TurtleShape):
-    def __init__(self):
+    def __init__(self, verbose=False):
         super().__init__()
-        
-    
-    def move(self, speed=0.5, length=2): 
-        print("Starting position: ", self.pose.x, self.pose.y)
-        for _ in range(2):
-            self.move_forward(speed=speed, distance=length)
-            print("Position after side", _ + 1, ":", self.pose.x, self.pose.y)
-            self.pub_checkpoint(_+1)
-            self.rotate_half_pi(speed=0.5)
-            print("Position after rotation", _ + 1, ":", self.pose.x, self.pose.y)
-            self.move_forward(speed=speed, distance=2*length)
-            print("Position after side", _ + 2, ":", self.pose.x, self.pose.y)
-            self.rotate_half_pi(speed=0.5)
-            print("Position after rotation", _ + 2, ":", self.pose.x, self.pose.y)
-            self.pub_checkpoint(_ + 2)
\ No newline at end of file
+        self.verbose = verbose
+        # checkpoint messages precomputed once instead of formatted per publish
+        self._checkpoint_msgs = [String(data=f"reached {i}") for i in range(1, 5)]
+
+    def move(self, speed=0.5, length=2):
+        if __debug__ and self.verbose:
+            print("Starting position: ", self.pose.x, self.pose.y)
+
+        # flat command table: (speed, distance, rotate_after) per side
+        plan = ((speed, length, True),
+                (speed, 2 * length, True),
+                (speed, length, True),
+                (speed, 2 * length, True))
+
+        for i, (s, d, rotate) in enumerate(plan):
+            self.move_forward(speed=s, distance=d)
+            self.checkpoint_publisher.publish(self._checkpoint_msgs[i])
+            if rotate:
+                self.rotate_half_pi(speed=0.5)
+            if __debug__ and self.verbose:
+                print("Position after side", i + 1, ":", self.pose.x, self.pose.y)
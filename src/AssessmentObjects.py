@@ -1,4 +1,5 @@
 # Description: Contains the classes for the assessment objects.
+import time
 import asyncio
 import rospy
 from GlobalEvents import GlobalEvents
@@ -34,12 +35,16 @@ class AssessmentObject:
     """
     Class to create an assessment object.
     """
-    def __init__(self, runtime_assessment, topic_name: str, message_class: Any, requirements: List) -> None:
+    def __init__(self, runtime_assessment, topic_name: str, message_class: Any, requirements: List,
+                 index: int = 0) -> None:
         # runtime assessment hooks and variables
         self.runtime_assessment = runtime_assessment
         self.node = runtime_assessment.node
         self.rate = runtime_assessment.rate
 
+        # slot in the runtime assessment's shared message-count array
+        self.index = index
+
         # Setup logger
         self.logger = logging.getLogger(f"AssessmentObject.{topic_name}")
         self.logger.addHandler(runtime_assessment.file_handler)
@@ -133,6 +138,7 @@ class AssessmentObject:
         if isinstance(data, self.message_class):
             # Update record
             self.save_record(self.topic_event_record, data)
+            self.runtime_assessment._msg_counts[self.index] += 1
             self.latest_topic_event = data
             if len(self.topic_event_record) == 1:
                 self.logger.info(f"Receiving data.")
@@ -145,7 +151,7 @@ class AssessmentObject:
         Start the assessment.
         :return: None
         """
-        self.start_time = rospy.get_time()
+        self.start_time = time.monotonic()
         self.create_subscribers()
 
     def end_assessment(self) -> None:
@@ -181,7 +187,7 @@ class AssessmentObject:
         Compute the time elapsed since the assessment started.
         :return: float
         """
-        return rospy.get_time() - self.start_time
+        return time.monotonic() - self.start_time
 
     def check_requirements(self) -> bool:
         """
@@ -322,18 +328,21 @@ class AssessmentObject:
 
         return
 
-    async def run(self) -> None:
+    async def run(self) -> Tuple[float, dict]:
         """
         Run the assessment.
-        :return: None
+        Returns the final message count and metrics so the caller can aggregate
+        them from the task results instead of re-walking the assessment pool.
+        :return: Tuple[float, dict]
         """
         while not rospy.is_shutdown() and not self.over:
 
             # check for new events
-            async with self.runtime_assessment.lock:
-                if len(self.runtime_assessment.global_event_queue) != 0:
-                    if self.latest_global_event != self.runtime_assessment.global_event_queue[-1]:
-                        self.latest_global_event = self.runtime_assessment.global_event_queue[-1]
-                        self.global_event_callback(self.latest_global_event)
+            if len(self.runtime_assessment.global_event_queue) != 0:
+                if self.latest_global_event != self.runtime_assessment.global_event_queue[-1]:
+                    self.latest_global_event = self.runtime_assessment.global_event_queue[-1]
+                    self.global_event_callback(self.latest_global_event)
+
+            await asyncio.sleep(self.rate.sleep_dur.to_sec())
 
-            await asyncio.sleep(self.rate.sleep_dur.to_sec())
\ No newline at end of file
+        return self.metrics['number_of_messages'], self.metrics
\ No newline at end of file
@@ -3,23 +3,106 @@
 
 import os
 import sys
+import time
+import queue
 import rospy
 import asyncio
 import rosnode
 import logging
+import logging.handlers
+import threading
+import numpy as np
 from utils import *
 from RuntimeAssessmentConfig import RuntimeAssessmentConfig
 from GlobalEvents import GlobalEvents
+from collections import deque
 from datetime import datetime
+from types import MappingProxyType
 from typing import Set
 from AssessmentObjects import AssessmentObject
 
 
+# Default requirement parameters, applied in one dict merge per requirement
+_TOPIC_DEFAULTS = MappingProxyType({'mode': "exists", 'temporal_consistency': False, 'timein': None,
+                                    'timeout': None, 'tolerance': 0.05, 'comparator': "="})
+_METRIC_DEFAULTS = MappingProxyType({'mode': "total", 'temporal_consistency': False, 'timein': None,
+                                     'timeout': None, 'tolerance': 0.05, 'comparator': "="})
+
+
+class MultiSinkHandler(logging.Handler):
+    """
+    Handler that formats each record once and writes the prebuilt bytes to
+    several level-filtered file sinks, instead of paying one Formatter pass
+    (and one flush) per file. Sinks are opened with a large buffer that a
+    periodic timer and close() flush, collapsing small writes into batches.
+    """
+
+    BUFFER_SIZE = 65536
+    FLUSH_INTERVAL = 0.1
+
+    def __init__(self, sinks: List[Tuple[str, int]]):
+        """
+        :param sinks: list of (filename, minimum level) pairs
+        """
+        super().__init__()
+        self._sinks = [(open(filename, 'ab', buffering=self.BUFFER_SIZE), min_level)
+                       for filename, min_level in sinks]
+        self._closed = False
+        self._flush_timer = None
+        self._schedule_flush()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            msg = (self.format(record) + "\n").encode()
+            for stream, min_level in self._sinks:
+                if record.levelno >= min_level:
+                    stream.write(msg)
+        except Exception:
+            self.handleError(record)
+
+    def flush(self) -> None:
+        self.acquire()
+        try:
+            # a timer fired between close() cancelling it and running may land here
+            if not self._closed:
+                for stream, _ in self._sinks:
+                    stream.flush()
+        finally:
+            self.release()
+
+    def _periodic_flush(self) -> None:
+        self.flush()
+        self._schedule_flush()
+
+    def _schedule_flush(self) -> None:
+        if self._closed:
+            return
+        self._flush_timer = threading.Timer(self.FLUSH_INTERVAL, self._periodic_flush)
+        self._flush_timer.daemon = True
+        self._flush_timer.start()
+
+    def close(self) -> None:
+        self.acquire()
+        try:
+            self._closed = True
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+            # closing the streams flushes whatever is still buffered
+            for stream, _ in self._sinks:
+                stream.close()
+        finally:
+            self.release()
+        super().close()
+
+
 class RuntimeAssessment:
     """
     Class to assess the runtime behavior of a ROS application.
     """
 
+    # number of watcher ticks a node listing stays cached before querying the master again
+    NODE_CACHE_TICKS = 5
+
     def __init__(self, config: RuntimeAssessmentConfig):
         # Initialize node
         try:
@@ -48,11 +131,26 @@ class RuntimeAssessment:
         self.is_running = False
         self.assessment_over = False
 
-        # Initialize queue for events that is accessed concurrently by the assessment objects
-        self.global_event_queue = []
+        # grace period granted to assessment tasks before they are cancelled at shutdown
+        self._shutdown_grace = 5.0
 
-        # Create lock for thread-safe access to the global_event_queue
-        self.lock = asyncio.Lock()
+        # Target node presence, updated by the watcher thread and signalled
+        # to the main coroutine through an asyncio.Event (created in async_run)
+        self._target_running = False
+        self._target_state_changed = None
+
+        # Event loop reference and shutdown event, set up in async_run so the
+        # rospy shutdown hook can wake the main coroutine immediately
+        self._loop = None
+        self._shutdown_event = None
+
+        # Cached node listing shared by the watcher ticks
+        self._node_cache = frozenset()
+        self._node_cache_age = self.NODE_CACHE_TICKS
+
+        # Initialize bounded queue for events that is accessed concurrently by the assessment objects.
+        # A deque with maxlen evicts old entries atomically, so no lock is needed on a single event loop.
+        self.global_event_queue = deque(maxlen=10)
 
         # Logger setup
         self.logger = logging.getLogger(f"RuntimeAssessment.{self.target_node}")
@@ -60,61 +158,146 @@ class RuntimeAssessment:
         # Get current date for file name generation
         current_date = datetime.now().strftime("%Y_%m_%d")
 
+        # Node short-name and formatter shared by every handler
+        short_name = self.target_node.split('/', 1)[1]
+        formatter = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+
         # Create target path if it does not exist
-        log_dir = os.path.join(self.logger_path, f"{self.target_node.split('/')[1]}_{current_date}")
+        log_dir = os.path.join(self.logger_path, f"{short_name}_{current_date}")
         os.makedirs(log_dir, exist_ok=True)
 
-        # Create shared file handler
-        log_file_path = os.path.join(log_dir, f"{self.target_node.split('/')[1]}_assessment.log")
-        self.file_handler = logging.FileHandler(log_file_path)
-        file_formatter = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
-        self.file_handler.setFormatter(file_formatter)
-        self.logger.addHandler(self.file_handler)
-
-        # INFO and Above Handler
-        info_handler = logging.FileHandler(os.path.join(log_dir, f"{self.target_node.split('/')[1]}_assessment_info.log"))
-        info_formatter = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
-        info_handler.setFormatter(info_formatter)
-        info_handler.setLevel(logging.INFO)
-        self.logger.addHandler(info_handler)
-
-        # ERROR and Above Handler
-        error_handler = logging.FileHandler(os.path.join(log_dir, f"{self.target_node.split('/')[1]}_assessment_error.log"))
-        error_formatter = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
-        error_handler.setFormatter(error_formatter)
-        error_handler.setLevel(logging.ERROR)
-        self.logger.addHandler(error_handler)
+        # One handler formats each record once and fans the bytes out to the
+        # three level-filtered log files: full log, INFO and above, ERROR and above
+        sink_handler = MultiSinkHandler([(os.path.join(log_dir, f"{short_name}_{suffix}"), level)
+                                         for suffix, level in (("assessment.log", logging.DEBUG),
+                                                               ("assessment_info.log", logging.INFO),
+                                                               ("assessment_error.log", logging.ERROR))])
+        sink_handler.setFormatter(formatter)
+
+        # Move file I/O off the event loop: the logger only enqueues records and a
+        # background listener thread owns the sink handler and performs the writes
+        log_queue = queue.SimpleQueue()
+        self._log_listener = logging.handlers.QueueListener(log_queue, sink_handler, respect_handler_level=True)
+        self._log_listener.start()
+        queue_handler = logging.handlers.QueueHandler(log_queue)
+        self.logger.addHandler(queue_handler)
+
+        # Shared handler used by the assessment objects' loggers
+        self.file_handler = queue_handler
 
         self.logger.info(" ------------ RUNTIME ASSESSMENT ------------ ")
 
         # import required message types for the assessments
-        for topic in self.topics.items():
-            self.topic_pairs[topic[0]] = import_message_type(topic)
+        for topic, msg_type in self.topics.items():
+            self.topic_pairs[topic] = import_message_type(msg_type)
 
         # create an assessment pool and initialize assessment objects
         self.assessment_pool = []
         self.assessment_object_allocator()
 
-    async def publish_global_event(self, event: GlobalEvents) -> None:
+    def publish_global_event(self, event: GlobalEvents) -> None:
         """
-        Publish a global event in a thread-safe way.
-        Enforce a size limit to the event queue.
+        Publish a global event.
+        The bounded deque enforces the queue size limit by evicting the oldest event.
+        Events are timestamped with time.time_ns(), which is far cheaper than
+        constructing a datetime; use iter_events for datetime views.
         :param event: GlobalEvents
         """
-        async with self.lock:
-            self.global_event_queue.append((datetime.now(), event))
-            print(f"Published Global Event: {event}.\n")
+        self.global_event_queue.append((time.time_ns(), event))
+        print(f"Published Global Event: {event}.\n")
 
-            # keep the queue size at maximum 10 events
-            if len(self.global_event_queue) > 10:
-                self.global_event_queue.pop(0)
+    def iter_events(self):
+        """
+        Iterate the queued global events as (datetime, event) pairs,
+        converting the stored nanosecond timestamps lazily.
+        :return: Iterator[Tuple]
+        """
+        for timestamp, event in self.global_event_queue:
+            yield datetime.fromtimestamp(timestamp / 1e9), event
 
     def run(self) -> None:
         """
         Run the assessment asynchronously.
         :return: None
         """
-        asyncio.run(self.async_run())
+        # Use the eager task factory when available (Python 3.12+) so coroutines
+        # that complete without suspending skip the full Task scheduling machinery.
+        loop = asyncio.new_event_loop()
+        eager_factory = getattr(asyncio, "eager_task_factory", None)
+        if eager_factory is not None:
+            loop.set_task_factory(eager_factory)
+        try:
+            loop.run_until_complete(self.async_run())
+        finally:
+            # mirror asyncio.run's cleanup: cancel and drain whatever is still
+            # pending (e.g. assessment tasks on the shutdown path) before closing
+            pending = asyncio.all_tasks(loop)
+            for task in pending:
+                task.cancel()
+            if pending:
+                loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+            loop.run_until_complete(loop.shutdown_asyncgens())
+            loop.close()
+
+    def _poll_nodes(self) -> frozenset:
+        """
+        Return the current set of ROS nodes as a frozenset.
+        The listing is memoized for NODE_CACHE_TICKS watcher ticks to cut master RPC load.
+        :return: frozenset
+        """
+        if self._node_cache_age >= self.NODE_CACHE_TICKS:
+            self._node_cache = frozenset(rosnode.get_node_names())
+            self._node_cache_age = 0
+
+            # log node membership changes only when they happen
+            if self._node_cache != self.previous_nodes:
+                changed = self._node_cache.symmetric_difference(self.previous_nodes)
+                self.logger.debug(f"Node membership changed: {sorted(changed)}")
+                self.previous_nodes = self._node_cache
+        else:
+            self._node_cache_age += 1
+
+        return self._node_cache
+
+    def _watch_target_node(self, loop: asyncio.AbstractEventLoop) -> None:
+        """
+        Poll the ROS master for the target node from a background thread.
+        Wakes the main coroutine only when the node's presence changes,
+        keeping the XML-RPC round-trips off the event loop.
+        :param loop: asyncio.AbstractEventLoop
+        :return: None
+        """
+        poll_interval = self.rate.sleep_dur.to_sec()
+
+        while not rospy.is_shutdown() and not self.assessment_over:
+            try:
+                target_running = self.target_node in self._poll_nodes()
+            except Exception:
+                target_running = False
+
+            # signal the main coroutine only on state transitions
+            if target_running != self._target_running:
+                self._target_running = target_running
+                loop.call_soon_threadsafe(self._target_state_changed.set)
+
+            time.sleep(poll_interval)
+
+        # wake the main coroutine one last time so it can observe shutdown;
+        # the loop may already be closed if the assessment ended during the last tick
+        try:
+            loop.call_soon_threadsafe(self._target_state_changed.set)
+        except RuntimeError:
+            pass
+
+    def _on_ros_shutdown(self) -> None:
+        """
+        rospy shutdown hook.
+        Wakes the main coroutine immediately instead of waiting for the next poll tick.
+        :return: None
+        """
+        if self._loop is not None and not self._loop.is_closed():
+            self._loop.call_soon_threadsafe(self._shutdown_event.set)
+            self._loop.call_soon_threadsafe(self._target_state_changed.set)
 
     async def async_run(self) -> None:
         """
@@ -126,52 +309,97 @@ class RuntimeAssessment:
         #
         assessment_tasks = [asyncio.create_task(obj.run()) for obj in self.assessment_pool]
 
-        while not rospy.is_shutdown() and not self.assessment_over:
-            target_running: bool = self.target_node in rosnode.get_node_names()
-
-            # running state
-            if self.is_running:
-                # target stopped running event leads to ending the assessment
-                if not target_running:
-                    # push global event indicating new state to the assessment objects and wait for their conclusion
-                    await self.publish_global_event(GlobalEvents.NODE_REMOVED)
-                    await asyncio.gather(*assessment_tasks)
-                    self.end_assessment()
-                else:
-                    await asyncio.sleep(self.rate.sleep_dur.to_sec())
+        # hook rospy shutdown so it is signalled to the loop instead of polled
+        self._loop = asyncio.get_running_loop()
+        self._target_state_changed = asyncio.Event()
+        self._shutdown_event = asyncio.Event()
+        rospy.on_shutdown(self._on_ros_shutdown)
+
+        # spawn the watcher thread that edge-triggers the state machine
+        watcher = threading.Thread(target=self._watch_target_node, args=(self._loop,), daemon=True)
+        watcher.start()
+
+        # state-transition table indexed by (is_running, target_running);
+        # keys with no entry mean the wakeup carried no actionable edge
+        transitions = {
+            (False, True): self._on_target_started,
+            (True, False): lambda: self._finalize(assessment_tasks),
+        }
+
+        while not self._shutdown_event.is_set() and not self.assessment_over:
+            # sleep until the watcher reports a change in the target node's state
+            await self._target_state_changed.wait()
+            self._target_state_changed.clear()
+
+            handler = transitions.get((self.is_running, self._target_running))
+            if handler is not None:
+                await handler()
+
+    async def _on_target_started(self) -> None:
+        """
+        Handle the target node appearing: notify the assessment objects and start the assessment.
+        :return: None
+        """
+        # push global event indicating new state to the assessment objects
+        self.publish_global_event(GlobalEvents.NODE_ADDED)
+        self.start_assessment()
 
-            # idle state
+    async def _finalize(self, assessment_tasks) -> None:
+        """
+        Push the NODE_REMOVED event, wait for the assessment tasks within the
+        shutdown grace period, cancel any stragglers and end the assessment.
+        :param assessment_tasks: List[asyncio.Task]
+        :return: None
+        """
+        # push global event indicating new state to the assessment objects and wait for their conclusion
+        self.publish_global_event(GlobalEvents.NODE_REMOVED)
+
+        # a metrics-only specification yields no assessment tasks to wait on
+        if assessment_tasks:
+            done, pending = await asyncio.wait(assessment_tasks, timeout=self._shutdown_grace)
+
+            # cancel whatever did not finish in time so shutdown latency stays bounded
+            if pending:
+                self.logger.error(f"{len(pending)} assessment task(s) exceeded the shutdown grace period. Cancelling...")
+                for task in pending:
+                    task.cancel()
+                await asyncio.gather(*pending, return_exceptions=True)
+
+                # cancelled tasks never returned their counts; fall back to the
+                # shared counter array instead of an undercounted partial sum
+                total_messages = self.aggregate_message_counts()
             else:
-                # target stopped running event leads to ending the assessment
-                if target_running:
-                    # push global event indicating new state to the assessment objects
-                    await self.publish_global_event(GlobalEvents.NODE_ADDED)
-                    self.start_assessment()
-                # sleep at the specified rate until the target node is started
-                else:
-                    await asyncio.sleep(self.rate.sleep_dur.to_sec())
+                # aggregate message counts from the results already in hand
+                # instead of re-walking the assessment pool
+                total_messages = sum(task.result()[0] for task in done if task.exception() is None)
+        else:
+            total_messages = 0
+
+        self.end_assessment(total_messages)
 
     def start_assessment(self) -> None:
         """
         Start the assessment.
         :return: None
         """
-        # record start time of the assessment
-        self.start_time = rospy.get_time()
+        # record start time of the assessment on the monotonic clock
+        self.start_time = time.monotonic()
 
         # update internal state
         self.is_paused = False
         self.is_running = True
         self.logger.info("Target node started. Initializing assessment...")
 
-    def end_assessment(self) -> None:
+    def end_assessment(self, total_messages: float = None) -> None:
         """
         End the assessment.
+        :param total_messages: float, message count collected from the task results
         :return: None
         """
         # compute global metrics
         self.metrics['execution_time'] = self.get_time_elapsed()
-        self.metrics['number_of_messages'] = self.aggregate_message_counts()
+        self.metrics['number_of_messages'] = total_messages if total_messages is not None \
+            else self.aggregate_message_counts()
         self.metrics['frequency'] = self.metrics['number_of_messages'] / self.metrics['execution_time']
 
         # log global metrics
@@ -189,12 +417,15 @@ class RuntimeAssessment:
         self.logger.info("----------------- END OF ASSESSMENT -----------------\n")
         self.assessment_over = True
 
+        # stop the listener to drain any queued records to disk
+        self._log_listener.stop()
+
     def get_time_elapsed(self) -> float:
         """
         Compute the time elapsed since the assessment started.
         :return: float
         """
-        return rospy.get_time() - self.start_time
+        return time.monotonic() - self.start_time
 
     def assessment_object_allocator(self) -> None:
         """
@@ -207,40 +438,100 @@ class RuntimeAssessment:
             # Map the corresponding message class
             message_class = self.topic_pairs[topic]
 
-            # set default values to missing parameters
-            for req in requirements:
-                # set default values for missing keys
-                req.setdefault('mode', "exists")
-                req.setdefault('temporal_consistency', False)
-                req.setdefault('timein', None)
-                req.setdefault('timeout', None)
-                req.setdefault('tolerance', 0.05)
-                req.setdefault('comparator', "=")
+            # fill in missing parameters with one dict merge per requirement
+            requirements[:] = [{**_TOPIC_DEFAULTS, **req} for req in requirements]
 
             # initialize the assessment object for the current topic
             assessment_object = AssessmentObject(runtime_assessment=self, topic_name=topic, message_class=message_class,
-                                                 requirements=requirements)
+                                                 requirements=requirements, index=len(self.assessment_pool))
 
             # add the initialized object to the assessment pool
             self.assessment_pool.append(assessment_object)
             self.logger.info(
                 f"Assessment object created for topic '{topic}' with message class {message_class} and {len(requirements)} requirements.")
 
+        # per-object message counters kept as one array so aggregation is a vectorized sum
+        self._msg_counts = np.zeros(len(self.assessment_pool), dtype=np.int64)
+
         # Global metric assessments
         for metric, requirements in self.specifications["metric"].items():
-            # set default values to missing parameters
+            # fill in missing parameters with one dict merge per requirement
+            requirements[:] = [{**_METRIC_DEFAULTS, **req} for req in requirements]
+
             for req in requirements:
-                # set default values for missing keys
-                req.setdefault('mode', "total")
-                req.setdefault('temporal_consistency', False)
-                req.setdefault('timein', None)
-                req.setdefault('timeout', None)
-                req.setdefault('tolerance', 0.05)
-                req.setdefault('comparator', "=")
+                # resolve the target and compile the comparator once so
+                # metric_assessment stays straight-line
+                req['_target'] = self._resolve_metric_target(req.get('target'))
+                req['_predicate'] = self._compile_predicate(req['_target'], req['tolerance'], req['comparator'])
 
             # append restructured dictionary of each metric assessment to assessment pool
             self.metrics_assessment_pool.append({'metric': metric, 'requirements': requirements})
 
+    @staticmethod
+    def _resolve_metric_target(target) -> Union[float, Tuple, None]:
+        """
+        Resolve a requirement target into a scalar or a (min, max) tuple.
+        Malformed targets resolve to None so they are rejected once at load time.
+        :param target: Any
+        :return: float || Tuple || None
+        """
+        if is_numeric(target):
+            return target
+
+        if isinstance(target, list):
+            # default range values to None
+            min_val = None
+            max_val = None
+
+            # iterate assessment value parameters
+            for limit in target:
+                for k, v in limit.items():
+                    if not is_numeric(v):
+                        return None
+
+                    if k == "min":
+                        min_val = v
+                    elif k == "max":
+                        max_val = v
+                    else:
+                        return None
+
+            # both bounds are required; a partial or empty range is malformed
+            if min_val is None or max_val is None:
+                return None
+
+            return (min_val, max_val)
+
+        return None
+
+    @staticmethod
+    def _compile_predicate(target, tolerance: float, comparator: str):
+        """
+        Compile a resolved requirement target into a single-argument predicate.
+        The comparator string is dispatched here, once at load time, instead of
+        on every evaluation. Returns None for invalid targets or comparators.
+        :param target: float || Tuple || None
+        :param tolerance: float
+        :param comparator: str
+        :return: Callable || None
+        """
+        if isinstance(target, tuple):
+            min_val, max_val = target
+            return lambda value: min_val < value < max_val
+
+        if is_numeric(target):
+            comparators = {
+                "=": lambda value: target * (1 - tolerance) < value < target * (1 + tolerance),
+                ">": lambda value: value > target,
+                "<": lambda value: value < target,
+                ">=": lambda value: value >= target,
+                "<=": lambda value: value <= target,
+                "!=": lambda value: value != target,
+            }
+            return comparators.get(comparator)
+
+        return None
+
     def metric_assessment(self):
         """
         Assess the global metrics.
@@ -248,88 +539,41 @@ class RuntimeAssessment:
         """
         # iterate all metric assessments scheduled
         for metric in self.metrics_assessment_pool:
+            name = metric['metric']
+            requirements = metric['requirements']
+
             # validate desired metric assessment
-            if metric['metric'] in list(self.metrics.keys()):
+            if name in self.metrics:
                 self.logger.info(
-                    f"Assessing metric '{metric['metric']}' with {len(metric['requirements'])} requirements.")
+                    f"Assessing metric '{name}' with {len(requirements)} requirements.")
 
             else:
-                self.logger.error(f"Metric '{metric['metric']}' not found.")
+                self.logger.error(f"Metric '{name}' not found.")
                 continue
 
+            value = self.metrics[name]
+
             # assess all requirements for current metric
-            for i, req in enumerate(metric['requirements']):
-                target = req['target']
-                tolerance = req['tolerance']
-                comparator = req['comparator']
-
-                value = self.metrics[metric['metric']]
-
-                # handle assessment value of type list
-                if isinstance(target, list):
-                    # default range values to None
-                    min_val = None
-                    max_val = None
-
-                    # iterate assessment value parameters
-                    for limit in target:
-                        for k, v in limit.items():
-                            # validate param
-                            if not is_numeric(v):
-                                self.logger.error(
-                                    f"Requirement {i + 1} of {len(metric['requirements'])} of metric '{metric['metric']}' FAILED - Invalid target value.")
-                                return
-
-                            if k == "min":
-                                min_val = v
-                            elif k == "max":
-                                max_val = v
-                            else:
-                                self.logger.error(
-                                    f"Requirement {i + 1} of {len(metric['requirements'])} of metric '{metric['metric']}' FAILED - Invalid target value.")
-                                return
-
-                    # perform the check and log the results
-                    try:
-                        if check_value_params(value, (min_val, max_val), comparator, tolerance):
-                            self.logger.info(
-                                f"Requirement {i + 1} of {len(metric['requirements'])} of metric '{metric['metric']}' PASSED.")
-                            continue
-                        else:
-                            self.logger.info(
-                                f"Requirement {i + 1} of {len(metric['requirements'])} of metric '{metric['metric']}' FAILED.")
-                            continue
-
-                    except Exception as e:
-                        self.logger.error(
-                            f"Requirement {i + 1} of {len(metric['requirements'])} of metric '{metric['metric']}' FAILED - {e}")
-                        return
-
-                # handle assessment value of type float or int
-                elif is_numeric(target):
-                    try:
-                        # perform the check and log the results
-                        if check_value_params(value, target, tolerance, comparator):
-                            self.logger.info(
-                                f"Requirement {i + 1} of {len(metric['requirements'])} of metric '{metric['metric']}' PASSED.")
-                            continue
-                        else:
-                            self.logger.info(
-                                f"Requirement {i + 1} of {len(metric['requirements'])} of metric '{metric['metric']}' FAILED.")
-                            continue
-
-                    except Exception as e:
-                        self.logger.error(
-                            f"Requirement {i + 1} of {len(metric['requirements'])} of metric '{metric['metric']}' FAILED - {e}")
-                        return
-                else:
+            for i, req in enumerate(requirements):
+                # predicates were compiled and validated once at allocation time
+                predicate = req['_predicate']
+
+                if predicate is None:
                     self.logger.error(
-                        f"Requirement {i + 1} of {len(metric['requirements'])} of metric '{metric['metric']}' FAILED - Invalid target value.")
+                        f"Requirement {i + 1} of {len(requirements)} of metric '{name}' FAILED - Invalid target or comparator.")
                     return
 
+                # perform the check and log the results
+                if predicate(value):
+                    self.logger.info(
+                        f"Requirement {i + 1} of {len(requirements)} of metric '{name}' PASSED.")
+                else:
+                    self.logger.info(
+                        f"Requirement {i + 1} of {len(requirements)} of metric '{name}' FAILED.")
+
     def aggregate_message_counts(self) -> int:
         """
         Aggregate the total number of messages from all assessment objects.
         :return: int
         """
-        return sum(obj.metrics['number_of_messages'] for obj in self.assessment_pool)
\ No newline at end of file
+        return int(self._msg_counts.sum())
\ No newline at end of file
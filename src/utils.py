@@ -1,7 +1,6 @@
-import yaml
+import functools
 from importlib import import_module
 from typing import List, Tuple, Any, Union
-import concurrent.futures
 
 
 def check_value_params(value: float, target: Union[float, Tuple], tolerance: float = 0.05, comp: str = "=") -> bool:
@@ -188,14 +187,14 @@ def get_average_value(attr: str, record: Tuple) -> float:
     return total / len(record)
 
 
-def import_message_type(topic_tuple: Tuple[str, str]) -> Any:
+@functools.lru_cache(maxsize=None)
+def import_message_type(msg_type: str) -> Any:
     """
-    Import message types from a dictionary of topic names to message types
-    :param topic_types: A tuple mapping topic names to message types
-    :return: Imported class 
+    Import the message class for a ROS message type string (e.g. 'std_msgs/String').
+    Results are memoized so repeated type strings resolve the module only once.
+    :param msg_type: str
+    :return: Imported class
     """
-    topic, msg_type = topic_tuple
-
     package_name, message_name = msg_type.split('/')
     package_name = package_name + '.msg'
 
@@ -203,9 +202,9 @@ def import_message_type(topic_tuple: Tuple[str, str]) -> Any:
         message_module = import_module(package_name)
         message_class = getattr(message_module, message_name)
         return message_class
-    
+
     except (AttributeError, ModuleNotFoundError) as e:
-        raise ValueError(f"Failed to import message type for topic '{topic}': {e}")
+        raise ValueError(f"Failed to import message type '{msg_type}': {e}")
     
 
 def has_attribute(obj: Any, attribute_path: str) -> bool: